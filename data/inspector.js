@@ -28,6 +28,7 @@ function _initialRender() {
     //
     const style = document.createElement("style");
     document.head.appendChild(style);
+    const imageRules = new Map(); // Selector -> Last rule inserted for it
 
     document.querySelectorAll(".LEGACY").forEach((element) => {
         const clsid = element.getAttribute("clsid");
@@ -110,14 +111,17 @@ function _initialRender() {
 
         // Bitmap
         if (image) {
-            python.get_image(image, edgeImage === "yes" || blttype === "edge", area.width, area.height, function(b64data) {
-                if (!b64data && element.children.length === 0) {
-                    element.style.backgroundColor = "red";
-                    element.classList.add("missing");
+            python.get_image(image, edgeImage === "yes" || blttype === "edge", area.width, area.height, function(dataURI) {
+                if (!dataURI) {
+                    if (element.children.length === 0) {
+                        element.style.backgroundColor = "red";
+                        element.classList.add("missing");
+                    }
                     return;
                 }
-                const rule = [`div[image="${image}"] {`];
-                rule.push(`background-image: url(data:image/png;base64,${b64data});`);
+                const selector = `div[image="${image}"]`;
+                const rule = [`${selector} {`];
+                rule.push(`background-image: url(${dataURI});`);
                 switch (blttype) {
                     case "tile":
                         rule.push("background-repeat: repeat;");
@@ -128,7 +132,13 @@ function _initialRender() {
                         break;
                 }
                 rule.push("}");
-                style.sheet.insertRule(rule.join(" "), style.sheet.cssRules.length);
+
+                // Elements sharing an image would otherwise insert the same rule again
+                const ruleText = rule.join(" ");
+                if (imageRules.get(selector) === ruleText)
+                    return;
+                imageRules.set(selector, ruleText);
+                style.sheet.insertRule(ruleText, style.sheet.cssRules.length);
             });
         }
 
@@ -188,24 +198,20 @@ function selectElement(id) {
     //
     // Highlight the currently selected item from elements tree.
     //
-    document.querySelectorAll(".LEGACY").forEach((element) => {
+    document.querySelectorAll(".LEGACY.selected").forEach((element) => {
         element.classList.remove("selected");
-        if (element.getAttribute("id") === id) {
-            element.classList.add("selected");
-        }
     });
+    document.getElementById(id)?.classList.add("selected");
 }
 
 function hoverElement(id) {
     //
     // Highlight the currently hovered item from elements tree.
     //
-    document.querySelectorAll(".LEGACY").forEach((element) => {
+    document.querySelectorAll(".LEGACY.hover").forEach((element) => {
         element.classList.remove("hover");
-        if (element.getAttribute("id") === id) {
-            element.classList.add("hover");
-        }
     });
+    document.getElementById(id)?.classList.add("hover");
 }
 
 function showElement(id) {
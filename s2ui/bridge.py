@@ -20,15 +20,15 @@ Rendering images is done in Python as the browser doesn't support TGA images.
 # Copyright (C) 2025 Luke Horwell <code@horwell.me>
 #
 import base64
+import collections
 import io
 
 import PIL.Image
 from PyQt6.QtCore import QObject, Qt, pyqtSlot
 from PyQt6.QtGui import QCursor
-from PyQt6.QtWidgets import QMenu, QTreeWidget, QTreeWidgetItemIterator
+from PyQt6.QtWidgets import QMenu, QTreeWidget
 
 import s2ui.rendering
-from s2ui.enums import ElementsColumnData
 from s2ui.state import State
 from submodules.sims2_4k_ui_patch.sims2patcher import dbpf, uiscript
 
@@ -40,12 +40,11 @@ def get_s2ui_element_id(element: uiscript.UIScriptElement) -> str:
     return f"s2ui_{id(element)}"
 
 
-def get_image_as_png(image_attr: str) -> io.BytesIO|None:
+def get_image_data(image_attr: str) -> bytes|None:
     """
     Extract an image from the currently loaded packages ("state").
-    For Qt and WebView compatibility, it will be converted to a PNG.
 
-    Return as an in-memory PNG image file.
+    Return the original image file data (usually TGA).
     """
     try:
         _group_id, _instance_id = image_attr[1:-1].split(",")
@@ -61,17 +60,43 @@ def get_image_as_png(image_attr: str) -> io.BytesIO|None:
         print(f"Image not found: Group ID {hex(group_id)}, Instance ID {hex(instance_id)}")
         return None
 
-    # Convert to PNG as browser doesn't support TGA
-    io_out = io.BytesIO()
     try:
-        io_in = io.BytesIO(entry.data_safe)
-        tga = PIL.Image.open(io_in)
-        tga = tga.convert("RGBA") # Remove transparency
-        tga.save(io_out, format="PNG")
+        return entry.data_safe
     except dbpf.errors.QFSError:
         print(f"Image failed to extract: Group ID {hex(group_id)}, Instance ID {hex(instance_id)}")
         return None
 
+
+def get_image_as_rgba(image_attr: str) -> PIL.Image.Image|None:
+    """
+    Extract an image from the currently loaded packages ("state").
+
+    Return as a decoded RGBA image, ready for post processing.
+    """
+    data = get_image_data(image_attr)
+    if data is None:
+        return None
+
+    tga = PIL.Image.open(io.BytesIO(data))
+    return tga.convert("RGBA") # Remove transparency
+
+
+def get_image_as_png(image_attr: str) -> io.BytesIO|None:
+    """
+    Extract an image from the currently loaded packages ("state").
+    For Qt and WebView compatibility, it will be converted to a PNG.
+
+    Return as an in-memory PNG image file.
+    """
+    tga = get_image_as_rgba(image_attr)
+    if tga is None:
+        return None
+
+    # Convert to PNG as browser doesn't support TGA
+    # These are only held in memory, so favour speed over file size
+    io_out = io.BytesIO()
+    tga.save(io_out, format="PNG", compress_level=1)
+
     io_out.seek(0)
     return io_out
 
@@ -84,11 +109,27 @@ class Bridge(QObject):
         super().__init__()
         self.element_tree = element_tree
         self.elements_menu = elements_menu
+        self.hovered_id = "" # Element currently highlighted in the tree
+
+        # Pages request the same images repeatedly, keep the most recently used encoded images
+        self.image_cache: collections.OrderedDict[tuple[str, bool, int, int], str] = collections.OrderedDict()
+        self.image_cache_size = 256
+
+        # Edge images are rendered at many sizes from the same original graphic
+        self.edge_slices: dict[str, s2ui.rendering.EdgeSlices] = {} # Image attribute -> Slices
+
+    def clear_cache(self):
+        """
+        Forget previously encoded images, such as when packages are reloaded.
+        """
+        self.image_cache.clear()
+        self.edge_slices.clear()
 
     @pyqtSlot(str, bool, int, int, result=str) # type: ignore
     def get_image(self, image_attr: str, is_edge_image: bool, width: int, height: int) -> str:
         """
-        Return a base64 encoded PNG image for a TGA graphic extracted from the package.
+        Return a TGA graphic extracted from the package as a data URI of a base64 encoded PNG,
+        ready to use in CSS. An empty string is returned if the image is missing.
 
         Additional attributes will be read to determine whether post-processing
         is required (such as to render a dialog background).
@@ -99,54 +140,61 @@ class Bridge(QObject):
             - is_edge_image: Whether edgeimage="yes" or "blttype="edge" is set
             - height and width of element (for post processing purposes)
         """
-        image = get_image_as_png(image_attr)
-        if image is None:
-            return ""
+        # Size only matters when post processing
+        key = (image_attr, is_edge_image, width, height) if is_edge_image else (image_attr, False, 0, 0)
+        if key in self.image_cache:
+            self.image_cache.move_to_end(key)
+            return self.image_cache[key]
 
         # Perform post processing if necessary
+        image = None
         if is_edge_image:
-            image = s2ui.rendering.render_edge_image(image, width, height)
-
-        return base64.b64encode(image.getvalue()).decode("utf-8")
+            slices = self.edge_slices.get(image_attr)
+            if slices is None:
+                original = get_image_as_rgba(image_attr)
+                if original is not None:
+                    slices = self.edge_slices[image_attr] = s2ui.rendering.EdgeSlices(original)
+            if slices is not None:
+                image = s2ui.rendering.render_edge_image(slices, width, height)
+        else:
+            image = get_image_as_png(image_attr)
+
+        encoded = ""
+        if image is not None:
+            encoded = "data:image/png;base64," + base64.b64encode(image.getvalue()).decode("ascii")
+
+        self.image_cache[key] = encoded
+        if len(self.image_cache) > self.image_cache_size:
+            self.image_cache.popitem(last=False)
+        return encoded
 
     @pyqtSlot(str)
     def select_element(self, element_id: str):
         """
         User clicked on an element in webview. Highlight new element in the tree.
         """
-        iterator = QTreeWidgetItemIterator(self.element_tree)
-        while iterator.value():
-            item = iterator.value()
-            if not item:
-                return
-
-            if item.data(ElementsColumnData.ELEMENT_ID_S2UI, Qt.ItemDataRole.UserRole) == element_id:
-                self.element_tree.setCurrentItem(item)
-                self.element_tree.scrollToItem(item)
-                break
-
-            iterator += 1
+        item = State.element_items.get(element_id)
+        if item:
+            self.element_tree.setCurrentItem(item)
+            self.element_tree.scrollToItem(item)
 
     @pyqtSlot(str)
     def hover_element(self, element_id: str):
         """
         User hovered over an element in webview. Highlight this element in the tree.
         """
-        iterator = QTreeWidgetItemIterator(self.element_tree)
-        while iterator.value():
-            item = iterator.value()
-            if not item:
-                return
-
-            if item.data(ElementsColumnData.ELEMENT_ID_S2UI, Qt.ItemDataRole.UserRole) == element_id:
-                for c in range(item.columnCount()):
-                    item.setBackground(c, Qt.GlobalColor.darkGray)
-            else:
-                # Reset background colour
-                for c in range(item.columnCount()):
-                    item.setData(c, Qt.ItemDataRole.BackgroundRole, None)
-
-            iterator += 1
+        # Reset background colour of the previously hovered element
+        item = State.element_items.get(self.hovered_id)
+        if item:
+            for c in range(item.columnCount()):
+                item.setData(c, Qt.ItemDataRole.BackgroundRole, None)
+
+        item = State.element_items.get(element_id)
+        if item:
+            for c in range(item.columnCount()):
+                item.setBackground(c, Qt.GlobalColor.darkGray)
+
+        self.hovered_id = element_id
 
     @pyqtSlot()
     def right_click_element(self):
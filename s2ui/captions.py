@@ -0,0 +1,175 @@
+"""
+Module that finds captions for UI scripts to hint at their purpose in the UI scripts tree.
+
+Scripts are searched in a thread pool so the interface stays responsive while loading.
+"""
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+# Copyright (C) 2025 Luke Horwell <code@horwell.me>
+#
+from PyQt6.QtCore import QObject, QRunnable, Qt, QThreadPool, pyqtSignal
+from PyQt6.QtWidgets import QTreeWidgetItem
+
+import s2ui.widgets
+from s2ui.enums import UIScriptColumnData, UIScriptColumnText
+from s2ui.state import State
+from submodules.sims2_4k_ui_patch.sims2patcher import uiscript
+
+# Elements likely to have user-facing captions, in order of preference
+CAPTION_IIDS = {iid: priority for priority, iid in enumerate(["IGZWinText", "IGZWinTextEdit", "IGZWinBtn", "IGZWinFlatRect", "IGZWinBMP", "IGZWinGen"])}
+
+
+def find_captions(root: uiscript.UIScriptRoot) -> list[str]:
+    """
+    Find the user-facing captions in a UI script, in a single pass of its elements.
+    Only captions from the most preferred type of element (see CAPTION_IIDS) are returned.
+    """
+    found: list[list[str]] = [[] for _ in CAPTION_IIDS]
+    for element in root.get_all_elements():
+        iid = element.attributes.get("iid", "")
+        caption = element.attributes.get("caption", "")
+        priority = CAPTION_IIDS.get(iid) if isinstance(iid, str) else None
+        if priority is None or not isinstance(caption, str) or not caption:
+            continue
+
+        # Exclude captions used for technical key/value data
+        # e.g. Ignore lowercase text, and things like "kCollapsedRows=1"
+        if "=" in caption or caption.isupper() or caption.islower():
+            continue
+
+        found[priority].append(caption)
+
+    # Only the captions that will be shown need their escaped line breaks replaced
+    captions = next((captions for captions in found if captions), [])
+    return [caption.replace("\\r\\n", " ") for caption in captions]
+
+
+class _CaptionTask(QRunnable):
+    """
+    Search UI scripts for captions in the thread pool.
+    Only the parsed scripts are read here, as tree items must only be used on the GUI thread.
+    """
+    def __init__(self, loader: "CaptionLoader", generation: int, scripts: list[tuple[int, uiscript.UIScriptRoot]]):
+        super().__init__()
+        self.loader = loader
+        self.generation = generation
+        self.scripts = scripts
+
+    def run(self):
+        """Find captions for each script, sending them back to the loader"""
+        # Results are sent in batches, so the tree is updated a batch at a time
+        results: dict[int, list[str]] = {}
+        for index, root in self.scripts:
+            captions = find_captions(root)
+            if captions:
+                results[index] = captions
+            if len(results) >= 200:
+                self.loader.found.emit(self.generation, results)
+                results = {}
+
+        if results:
+            self.loader.found.emit(self.generation, results)
+        self.loader.done.emit(self.generation)
+
+
+class CaptionLoader(QObject):
+    """
+    Set the caption column for items in the UI scripts tree, searching for them in the background.
+    """
+    found = pyqtSignal(int, dict) # Generation, {Index: Captions}
+    done = pyqtSignal(int) # Generation
+    finished = pyqtSignal() # All captions for the current packages were set
+
+    def __init__(self):
+        super().__init__()
+        self.items: dict[int, QTreeWidgetItem] = {} # Index -> Item waiting for a caption
+        self.generation = 0 # Ignore captions found for previously loaded packages
+        self.running = 0 # Searches still in the thread pool for this generation
+
+        self.found.connect(self._found)
+        self.done.connect(self._done)
+
+    def start(self, items: list[QTreeWidgetItem]):
+        """
+        Begin finding captions for these items in the UI scripts tree.
+        """
+        scripts = []
+        for item in items:
+            index: int = item.data(UIScriptColumnData.ENTRY_INDEX, Qt.ItemDataRole.UserRole)
+            entry = State.uiscript_entries[index]
+            data = State.uiscripts.get(index)
+
+            if entry.decompressed_size > 1024 * 1024:
+                item.setText(UIScriptColumnText.CAPTION, "Binary data")
+                item.setDisabled(True)
+                continue
+
+            if not data:
+                continue
+
+            self.items[index] = item
+            scripts.append((index, data))
+
+        self.running += 1
+        QThreadPool.globalInstance().start(_CaptionTask(self, self.generation, scripts))
+
+    def _found(self, generation: int, results: dict[int, list[str]]):
+        """
+        Captions were found in the thread pool. Now on the GUI thread, show them in the tree.
+        """
+        if generation != self.generation:
+            return
+
+        items: list[tuple[QTreeWidgetItem, list[str]]] = []
+        for index, captions in results.items():
+            item = self.items.pop(index, None)
+            if item:
+                items.append((item, captions))
+
+        tree = items[0][0].treeWidget() if items else None
+        if not tree:
+            return
+
+        column_id = UIScriptColumnText.CAPTION
+        with s2ui.widgets.batch_changes(tree):
+            for item, captions in items:
+                # Use first found caption as the hint
+                item.setText(column_id, captions[0])
+                item.setToolTip(column_id, "\n".join(captions))
+
+                # For grouped items, update the parent
+                parent = item.parent()
+                if parent:
+                    parent.setText(column_id, max(captions, key=len))
+                    parent.setToolTip(column_id, "\n".join(captions))
+
+    def _done(self, generation: int):
+        """
+        A search in the thread pool is complete. Once none are left, all captions are set.
+        """
+        if generation != self.generation:
+            return
+
+        self.running -= 1
+        if self.running == 0:
+            self.finished.emit()
+
+    def clear(self):
+        """
+        Stop setting captions, such as when packages are reloaded.
+        """
+        self.items = {}
+        self.running = 0
+        self.generation += 1
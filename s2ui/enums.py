@@ -15,8 +15,7 @@ class UIScriptColumnText(IntEnum):
 
 class UIScriptColumnData(IntEnum):
     """Data column IDs for the UI script tree (user role)"""
-    DBPF_ENTRY = 0
-    UISCRIPT_ROOT = 1
+    ENTRY_INDEX = 0 # Index for State.uiscript_entries and State.uiscripts
     CHECKSUM = 3
 
 
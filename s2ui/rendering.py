@@ -23,7 +23,40 @@ import io
 import PIL.Image
 
 
-def render_edge_image(original_io: io.BytesIO, width: int, height: int) -> io.BytesIO:
+class EdgeSlices:
+    """
+    Regions of an original graphic used to render an "edgeimage" at any size.
+    These only depend on the original graphic, so they can be reused between renders.
+    """
+    def __init__(self, original: PIL.Image.Image):
+        # Resize original image if it has odd dimensions
+        if original.width % 2 != 0:
+            original = original.resize((original.width + 1, original.height))
+        if original.height % 2 != 0:
+            original = original.resize((original.width, original.height + 1))
+
+        # The corners are painted using the first quarter regions of the original image
+        self.corner_w = corner_w = original.width // 2
+        self.corner_h = corner_h = original.height // 2
+
+        # Extract regions from the original image
+        # -- Corners
+        self.top_left = original.crop((0, 0, corner_w, corner_h))
+        self.top_right = original.crop((corner_w, 0, original.width, corner_h))
+        self.bottom_left = original.crop((0, corner_h, corner_w, original.height))
+        self.bottom_right = original.crop((corner_w, corner_h, original.width, original.height))
+
+        # -- Edges
+        self.top_edge = original.crop((corner_w, 0, corner_w + 1, corner_h))
+        self.bottom_edge = original.crop((corner_w, corner_h, corner_w + 1, original.height))
+        self.left_edge = original.crop((0, corner_h, corner_w, corner_h + 1))
+        self.right_edge = original.crop((corner_w, corner_h, original.width, corner_h + 1))
+
+        # -- Center
+        self.center = original.crop((corner_w, corner_h, corner_w + 1, corner_h + 1))
+
+
+def render_edge_image(slices: EdgeSlices, width: int, height: int) -> io.BytesIO:
     """
     Generate a new image replicating how the game renders an image with "edgeimage" set.
 
@@ -47,46 +80,31 @@ def render_edge_image(original_io: io.BytesIO, width: int, height: int) -> io.By
         - 0x499db772 0xa9500615 (90x186 pixels) - as used for many question dialogs
         - 0x499db772 0x14500100 (90x90 pixels) - as used for "Moving Family" progress dialog
     """
-    original = PIL.Image.open(original_io).convert("RGBA")
     canvas = PIL.Image.new("RGBA", (width, height), (0, 0, 0, 0))
-
-    # Resize original image if it has odd dimensions
-    if original.width % 2 != 0:
-        original = original.resize((original.width + 1, original.height))
-    if original.height % 2 != 0:
-        original = original.resize((original.width, original.height + 1))
-
-    # The corners are painted using the first quarter regions of the original image
-    corner_w = original.width // 2
-    corner_h = original.height // 2
-
-    # Extract regions from the original image
-    # -- Corners
-    top_left = original.crop((0, 0, corner_w, corner_h))
-    top_right = original.crop((corner_w, 0, original.width, corner_h))
-    bottom_left = original.crop((0, corner_h, corner_w, original.height))
-    bottom_right = original.crop((corner_w, corner_h, original.width, original.height))
-
-    # -- Edges
-    top_edge = original.crop((corner_w, 0, corner_w + 1, corner_h))
-    bottom_edge = original.crop((corner_w, corner_h, corner_w + 1, original.height))
-    left_edge = original.crop((0, corner_h, corner_w, corner_h + 1))
-    right_edge = original.crop((corner_w, corner_h, original.width, corner_h + 1))
+    corner_w = slices.corner_w
+    corner_h = slices.corner_h
+    top_edge = slices.top_edge
+    bottom_edge = slices.bottom_edge
+    left_edge = slices.left_edge
+    right_edge = slices.right_edge
+    center = slices.center
 
     # Stretch the edges to fit the dimensions
+    # As they're one pixel wide (or tall), nearest neighbour gives the same result as filtering, but faster
+    stretch = PIL.Image.Resampling.NEAREST
     if width - 2 * corner_w > 0:
-        top_edge = top_edge.resize((width - 2 * corner_w, corner_h))
-        bottom_edge = bottom_edge.resize((width - 2 * corner_w, corner_h))
+        top_edge = top_edge.resize((width - 2 * corner_w, corner_h), stretch)
+        bottom_edge = bottom_edge.resize((width - 2 * corner_w, corner_h), stretch)
     if height - 2 * corner_h > 0:
-        left_edge = left_edge.resize((corner_w, height - 2 * corner_h))
-        right_edge = right_edge.resize((corner_w, height - 2 * corner_h))
+        left_edge = left_edge.resize((corner_w, height - 2 * corner_h), stretch)
+        right_edge = right_edge.resize((corner_w, height - 2 * corner_h), stretch)
 
     # Paste all regions onto the canvas
     # -- Corners
-    canvas.paste(bottom_left, (0, height - corner_h))
-    canvas.paste(bottom_right, (width - corner_w, height - corner_h))
-    canvas.paste(top_left, (0, 0))
-    canvas.paste(top_right, (width - corner_w, 0))
+    canvas.paste(slices.bottom_left, (0, height - corner_h))
+    canvas.paste(slices.bottom_right, (width - corner_w, height - corner_h))
+    canvas.paste(slices.top_left, (0, 0))
+    canvas.paste(slices.top_right, (width - corner_w, 0))
 
     # -- Edges
     canvas.paste(bottom_edge, (corner_w, height - corner_h))
@@ -95,11 +113,10 @@ def render_edge_image(original_io: io.BytesIO, width: int, height: int) -> io.By
     canvas.paste(right_edge, (width - corner_w, corner_h))
 
     # -- Center
-    center = original.crop((corner_w, corner_h, corner_w + 1, corner_h + 1))
     if (width - 2 * corner_w) > 0 and (height - 2 * corner_h) > 0:
-        center = center.resize((width - 2 * corner_w, height - 2 * corner_h))
+        center = center.resize((width - 2 * corner_w, height - 2 * corner_h), stretch)
     canvas.paste(center, (corner_w, corner_h))
 
     output = io.BytesIO()
-    canvas.save(output, format="PNG")
+    canvas.save(output, format="PNG", compress_level=1) # Only held in memory, favour speed over file size
     return output
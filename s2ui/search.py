@@ -19,13 +19,14 @@ Module for globally searching all UI Scripts for attributes, values or pairs.
 #
 
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import (QAbstractScrollArea, QDialog, QHBoxLayout,
                              QLineEdit, QMainWindow, QToolButton, QTreeWidget,
                              QTreeWidgetItem, QVBoxLayout)
 
 from s2ui.bridge import get_s2ui_element_id
-from s2ui.widgets import iterate_children
+from s2ui.enums import UIScriptColumnData
+from s2ui.state import State
+from s2ui.widgets import get_icon, iterate_children
 from submodules.sims2_4k_ui_patch.sims2patcher import uiscript
 
 
@@ -68,7 +69,7 @@ class GlobalSearchDialog(QDialog):
         self.search_btn = QToolButton()
         self.search_btn.setText("Search")
         self.search_btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
-        self.search_btn.setIcon(QIcon.fromTheme("edit-find"))
+        self.search_btn.setIcon(get_icon("edit-find"))
         self.search_btn.clicked.connect(self.search)
 
         self.search_layout.addWidget(self.search_box_attrib)
@@ -141,8 +142,12 @@ class GlobalSearchDialog(QDialog):
             if not item:
                 continue
 
-            root: uiscript.UIScriptRoot = item.data(1, Qt.ItemDataRole.UserRole)
-            if not item or not root:
+            index: int|None = item.data(UIScriptColumnData.ENTRY_INDEX, Qt.ItemDataRole.UserRole)
+            if index is None:
+                continue
+
+            root = State.uiscripts.get(index)
+            if not root:
                 continue
 
             for element in root.get_all_elements():
@@ -192,13 +197,10 @@ class GlobalSearchDialog(QDialog):
         self.uiscripts_tree.setCurrentItem(uiscript_item)
         self.uiscripts_tree.scrollToItem(uiscript_item)
 
-        element_tree_root = self.elements_tree.invisibleRootItem()
-        if element_tree_root:
-            for child in iterate_children(element_tree_root):
-                if child.data(2, Qt.ItemDataRole.UserRole) == element_id:
-                    self.elements_tree.setCurrentItem(child)
-                    self.elements_tree.scrollToItem(child)
-                    break
+        element_item = State.element_items.get(element_id)
+        if element_item:
+            self.elements_tree.setCurrentItem(element_item)
+            self.elements_tree.scrollToItem(element_item)
 
         attribute_tree_root = self.attributes_tree.invisibleRootItem()
         if attribute_tree_root:
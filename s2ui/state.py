@@ -1,7 +1,9 @@
 """
 Shared state of the application
 """
-from submodules.sims2_4k_ui_patch.sims2patcher import dbpf
+from PyQt6.QtWidgets import QTreeWidgetItem
+
+from submodules.sims2_4k_ui_patch.sims2patcher import dbpf, uiscript
 
 
 class State:
@@ -13,5 +15,12 @@ class State:
     file_list: list[str] = [] # List of paths
     graphics: dict[tuple, dbpf.Entry] = {} # (group_id, instance_id) -> Entry
 
+    # UI script tree items reference these by index, rather than holding the objects
+    uiscript_entries: list[dbpf.Entry] = [] # Index -> Entry
+    uiscripts: dict[int, uiscript.UIScriptRoot] = {} # Index -> Parsed UI script
+
+    # Items in the elements tree for the current UI script, to look up elements clicked in the webview
+    element_items: dict[str, QTreeWidgetItem] = {} # S2UI element ID -> Item
+
     current_group_id = 0x0
     current_instance_id = 0x0
@@ -0,0 +1,173 @@
+"""
+Module that generates the small icons of graphics shown in the elements tree.
+
+Images are decoded in a thread pool so large UI scripts don't hold up the interface.
+"""
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+# Copyright (C) 2025 Luke Horwell <code@horwell.me>
+#
+import io
+
+import PIL.Image
+from PyQt6.QtCore import QObject, QRunnable, Qt, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QIcon, QImage, QPainter, QPixmap
+from PyQt6.QtWidgets import QTreeWidgetItem
+
+from s2ui.bridge import get_image_data
+from s2ui.enums import ElementsColumnText
+
+
+def render_thumbnail(data: bytes, is_button: bool) -> QImage:
+    """
+    Decode an image (such as TGA) into a 16x16 thumbnail.
+    For buttons, only the second 1/4 (normal state) is used.
+
+    Only QImage is used here, as QPixmap can't be used outside the GUI thread.
+    """
+    original = PIL.Image.open(io.BytesIO(data))
+
+    # For buttons, crop to the second 1/4 (normal state) before converting, so only that part is copied
+    if is_button:
+        quarter = original.width // 4
+        original = original.crop((quarter, 0, quarter * 2, original.height))
+
+    original = original.convert("RGBA")
+    image = QImage(original.tobytes(), original.width, original.height, original.width * 4, QImage.Format.Format_RGBA8888).copy()
+
+    # Scale to square aspect ratio (16x16) for uniformity
+    # Smooth scaling is barely noticeable at this size for small images
+    if image.width() <= 32 and image.height() <= 32:
+        mode = Qt.TransformationMode.FastTransformation
+    else:
+        mode = Qt.TransformationMode.SmoothTransformation
+
+    if image.width() == image.height():
+        # Already square, no need to center it
+        if image.width() != 16:
+            image = image.scaled(16, 16, Qt.AspectRatioMode.KeepAspectRatio, mode)
+        return image
+
+    scaled = image.scaled(16, 16, Qt.AspectRatioMode.KeepAspectRatio, mode)
+    square = QImage(16, 16, QImage.Format.Format_ARGB32_Premultiplied)
+    square.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(square)
+    x = (16 - scaled.width()) // 2
+    y = (16 - scaled.height()) // 2
+    painter.drawImage(x, y, scaled)
+    painter.end()
+    return square
+
+
+class _ThumbnailTask(QRunnable):
+    """
+    Decode a thumbnail in the thread pool.
+    """
+    def __init__(self, loader: "ThumbnailLoader", generation: int, key: tuple[str, bool], data: bytes):
+        super().__init__()
+        self.loader = loader
+        self.generation = generation
+        self.key = key
+        self.data = data
+
+    def run(self):
+        """Decode the thumbnail, sending it (or None if it couldn't be decoded) back to the loader"""
+        try:
+            image = render_thumbnail(self.data, self.key[1])
+        except (OSError, ValueError):
+            image = None
+        self.loader.decoded.emit(self.generation, self.key, image)
+
+
+class ThumbnailLoader(QObject):
+    """
+    Set icons on items in the elements tree, decoding them in the background.
+    Scripts tend to reuse the same images, so icons are cached until cleared.
+    """
+    decoded = pyqtSignal(int, object, object) # Generation, (Image attribute, Is button), QImage or None if it couldn't be decoded
+
+    def __init__(self):
+        super().__init__()
+        self.icons: dict[tuple[str, bool], QIcon|None] = {} # (Image attribute, Is button) -> Icon, or None if missing
+        self.pending: dict[tuple[str, bool], list[QTreeWidgetItem]] = {} # Items waiting for an icon
+        self.generation = 0 # Ignore images decoded for previously loaded packages
+
+        missing_pixmap = QPixmap(16, 16)
+        missing_pixmap.fill(Qt.GlobalColor.red)
+        self.missing_icon = QIcon(missing_pixmap)
+
+        self.decoded.connect(self._decoded)
+
+    def set_icon(self, item: QTreeWidgetItem, image_attr: str, is_button: bool):
+        """
+        Set an item's icon for an image attribute. When the icon isn't cached yet,
+        it will be set once it is decoded. Items for missing images are highlighted.
+        """
+        key = (image_attr, is_button)
+        if key in self.icons:
+            self._apply_icon(item, key)
+            return
+
+        if key in self.pending:
+            self.pending[key].append(item)
+            return
+
+        # Packages are read here, as they're not safe to read from multiple threads
+        data = get_image_data(image_attr)
+        if data is None:
+            self.icons[key] = None
+            self._apply_icon(item, key)
+            return
+
+        self.pending[key] = [item]
+        QThreadPool.globalInstance().start(_ThumbnailTask(self, self.generation, key, data))
+
+    def _apply_icon(self, item: QTreeWidgetItem, key: tuple[str, bool]):
+        """
+        Set a cached icon on an item, or highlight the item if the image is missing.
+        """
+        icon = self.icons[key]
+        if icon is not None:
+            item.setIcon(ElementsColumnText.ELEMENT, icon)
+            return
+
+        item.setIcon(ElementsColumnText.ELEMENT, self.missing_icon)
+        item.setToolTip(ElementsColumnText.ELEMENT, f"Missing bitmap: {key[0]}")
+        item.setForeground(ElementsColumnText.ELEMENT, Qt.GlobalColor.red)
+
+    def _decoded(self, generation: int, key: tuple[str, bool], image: QImage|None):
+        """
+        A thumbnail was decoded in the thread pool. Now on the GUI thread, cache and set its icon.
+        """
+        if generation != self.generation:
+            return
+
+        self.icons[key] = QIcon(QPixmap.fromImage(image)) if image is not None and not image.isNull() else None
+        for item in self.pending.pop(key, []):
+            self._apply_icon(item, key)
+
+    def forget_items(self):
+        """
+        Stop setting icons for items waiting on one, such as before the tree is cleared.
+        """
+        self.pending = {}
+
+    def clear(self):
+        """
+        Clear the cache, such as when packages are reloaded.
+        """
+        self.icons = {}
+        self.pending = {}
+        self.generation += 1
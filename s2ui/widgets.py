@@ -17,7 +17,8 @@ Module for Qt widgets used in the UI.
 #
 # Copyright (C) 2025 Luke Horwell <code@horwell.me>
 #
-from typing import Callable
+from contextlib import contextmanager
+from typing import Callable, Iterator
 
 from PyQt6.QtCore import QSize, Qt
 from PyQt6.QtGui import QAction, QCursor, QIcon, QKeySequence, QShortcut
@@ -26,6 +27,19 @@ from PyQt6.QtWidgets import (QAbstractScrollArea, QDockWidget, QLineEdit,
                              QTreeWidgetItem, QVBoxLayout, QWidget)
 
 
+_icon_cache: dict[str, QIcon] = {}
+
+
+def get_icon(name: str) -> QIcon:
+    """
+    Get an icon from the system's icon theme.
+    Many actions share the same icon, so each name is only looked up once.
+    """
+    if name not in _icon_cache:
+        _icon_cache[name] = QIcon.fromTheme(name)
+    return _icon_cache[name]
+
+
 def iterate_children(item: QTreeWidgetItem) -> list[QTreeWidgetItem]:
     """
     Get all children of a tree widget item recursively.
@@ -42,6 +56,25 @@ def iterate_children(item: QTreeWidgetItem) -> list[QTreeWidgetItem]:
     return children
 
 
+@contextmanager
+def batch_changes(tree: QTreeWidget) -> Iterator[QTreeWidget]:
+    """
+    Pause repainting, sorting and signals while making many changes to a tree's items,
+    so the tree is laid out and sorted once and item change handlers are not triggered.
+    """
+    was_enabled = tree.updatesEnabled()
+    was_sorted = tree.isSortingEnabled()
+    was_blocked = tree.blockSignals(True)
+    tree.setUpdatesEnabled(False)
+    tree.setSortingEnabled(False)
+    try:
+        yield tree
+    finally:
+        tree.setSortingEnabled(was_sorted)
+        tree.blockSignals(was_blocked)
+        tree.setUpdatesEnabled(was_enabled)
+
+
 class DockTree(QDockWidget):
     """A dock widget with a title and a tree widget."""
     def __init__(self, parent: QMainWindow, title: str, min_width: int, position: Qt.DockWidgetArea):
@@ -107,7 +140,7 @@ class DockTree(QDockWidget):
         if not header:
             return
 
-        icon = QIcon.fromTheme(icon_name)
+        icon = get_icon(icon_name)
         if icon.isNull():
             return
 
@@ -20,42 +20,49 @@ S2UI Inspector is a cross-platform PyQt6 application that browses
 and recreates user interfaces from The Sims 2. It parses UI Scripts
 and graphics for visual inspection outside the game.
 """
-import glob
+import concurrent.futures
 import hashlib
 import os
+import re
 import signal
 import sys
-import webbrowser
+from typing import Callable, NamedTuple
 
 import setproctitle
 from PyQt6.QtCore import Qt, QTimer, QUrl
-from PyQt6.QtGui import (QAction, QColor, QFontDatabase, QIcon, QImage,
-                         QKeySequence, QPainter, QPixmap)
+from PyQt6.QtGui import (QAction, QColor, QDesktopServices, QFontDatabase,
+                         QIcon, QKeySequence, QPixmap)
 from PyQt6.QtWebChannel import QWebChannel
 from PyQt6.QtWebEngineCore import QWebEnginePage
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWidgets import (QAbstractScrollArea, QApplication, QDialog,
                              QDialogButtonBox, QFileDialog, QHBoxLayout,
                              QMainWindow, QMenu, QMenuBar, QMessageBox,
-                             QSplitter, QStatusBar, QStyle, QTextEdit,
+                             QPlainTextEdit, QSplitter, QStatusBar, QStyle,
                              QTreeWidget, QTreeWidgetItem, QVBoxLayout,
                              QWidget)
 
+import s2ui.captions
 import s2ui.config
 import s2ui.fontstyles
 import s2ui.known
 import s2ui.search
+import s2ui.thumbnails
 import s2ui.widgets
-from s2ui.bridge import Bridge, get_image_as_png, get_s2ui_element_id
+from s2ui.bridge import Bridge, get_s2ui_element_id
 from s2ui.enums import (ElementsColumnData, ElementsColumnText,
                         PropertiesColumnText, UIScriptColumnData,
                         UIScriptColumnText)
 from s2ui.state import State
+from s2ui.widgets import get_icon
 from submodules.sims2_4k_ui_patch.sims2patcher import dbpf, uiscript
 
 PROJECT_URL = "https://github.com/lah7/sims2-ui-inspector"
 VERSION = "0.3.0"
 
+AREA_PATTERN = re.compile(r"\(\s*(-?\d+)\s*,\s*(-?\d+)\s*,\s*(-?\d+)\s*,\s*(-?\d+)\s*\)") # (X, Y, Width, Height)
+RGB_PATTERN = re.compile(r"\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)") # (R, G, B)
+
 
 @staticmethod
 def get_resource(filename: str) -> str:
@@ -69,6 +76,56 @@ def get_resource(filename: str) -> str:
     return os.path.join(data_dir, filename)
 
 
+def find_files(path: str, filenames: list[str]) -> list[str]:
+    """
+    Recursively search a directory for files with these names, in a single walk.
+    Like glob, names are case insensitive on Windows and hidden folders are skipped.
+    Results are in the order of the file names given, then in the order they were walked.
+    """
+    wanted = {os.path.normcase(filename): filename for filename in filenames}
+    found: dict[str, list[str]] = {filename: [] for filename in filenames}
+
+    for root, dirs, files in os.walk(path):
+        dirs[:] = [name for name in dirs if not name.startswith(".")]
+        for name in files:
+            filename = wanted.get(os.path.normcase(name))
+            if filename:
+                found[filename].append(os.path.join(root, name))
+
+    return [filepath for paths in found.values() for filepath in paths]
+
+
+def get_checksum(entry: dbpf.Entry) -> str:
+    """
+    Get a checksum for a UI script to identify identical copies across packages.
+    The decompressed data is hashed, so copies compressed differently still match.
+    """
+    if entry.decompressed_size > 1024 * 1024:
+        return "Binary data"
+
+    try:
+        return get_data_checksum(entry.data_safe)
+    except dbpf.errors.ArrayTooSmall:
+        return "Compression error"
+
+
+def get_data_checksum(data: bytes) -> str:
+    """
+    Get the checksum for data already read from a package.
+    Hashing releases the GIL, so this can be used from other threads.
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class UIScriptFile(NamedTuple):
+    """
+    An instance of a UI script, and where it was found.
+    """
+    entry: dbpf.Entry
+    package: str
+    game: str
+
+
 class MainInspectorWindow(QMainWindow):
     """
     Main interface for inspecting .uiScript files
@@ -77,7 +134,14 @@ class MainInspectorWindow(QMainWindow):
         super().__init__()
         self.config = s2ui.config.Preferences()
         self.fonts: dict[str, s2ui.fontstyles.FontStyle] = {}
+        self.fonts_css = "" # Stylesheet for self.fonts
+        self.font_style_paths: list[str] = [] # FontStyle.ini files found by discover_files()
         self.preload_items: list[QTreeWidgetItem] = []
+        self.uiscript_html: dict[int, str] = {} # Index -> Rendered HTML (cached)
+        self.uiscript_sources: dict[int, str] = {} # Index -> Original code (cached)
+        self.thumbnails = s2ui.thumbnails.ThumbnailLoader()
+        self.captions = s2ui.captions.CaptionLoader()
+        self.captions.finished.connect(self._captions_finished)
 
         # Layout
         self.base_widget = QWidget()
@@ -95,6 +159,7 @@ class MainInspectorWindow(QMainWindow):
         self.uiscript_dock.tree.setColumnWidth(3, 130)
         self.uiscript_dock.tree.setColumnWidth(4, 100)
         self.uiscript_dock.tree.setSortingEnabled(True)
+        self.uiscript_dock.tree.setUniformRowHeights(True)
         self.uiscript_dock.tree.currentItemChanged.connect(self.inspect_ui_file)
 
         # Dock: Elements
@@ -103,9 +168,15 @@ class MainInspectorWindow(QMainWindow):
         self.elements_dock.tree.setColumnWidth(ElementsColumnText.ELEMENT, 225)
         self.elements_dock.tree.setColumnWidth(ElementsColumnText.SHOWN, 30)
         self.elements_dock.tree.setColumnWidth(ElementsColumnText.IGNORE, 30)
+        self.elements_dock.tree.setUniformRowHeights(True)
         self.elements_dock.tree.currentItemChanged.connect(self.inspect_element)
         self.elements_dock.tree.setMouseTracking(True)
         self.elements_dock.tree.itemEntered.connect(self.hover_element)
+        self.hovered_element_id = ""
+        self.hover_timer = QTimer(self) # Send at most one hover to the webview per frame
+        self.hover_timer.setSingleShot(True)
+        self.hover_timer.setInterval(16)
+        self.hover_timer.timeout.connect(lambda: self.webview_page.runJavaScript(f"hoverElement('{self.hovered_element_id}')"))
         self.elements_dock.setup_column_change(ElementsColumnText.SHOWN, self.update_element_visibility)
         self.elements_dock.setup_column_change(ElementsColumnText.IGNORE, self.update_element_ignored)
         self.elements_dock.set_header_column_icon(ElementsColumnText.SHOWN, "view-visible", "Show Element")
@@ -116,6 +187,13 @@ class MainInspectorWindow(QMainWindow):
         self.properties_dock.tree.setHeaderLabels(["Attribute", "Value"])
         self.properties_dock.tree.setColumnWidth(0, 200)
         self.properties_dock.tree.setSortingEnabled(True)
+
+        # Attributes that have their values broken down in the properties dock
+        self.property_handlers: dict[str, Callable[[QTreeWidgetItem, str], None]] = {
+            "area": self._expand_area,
+            "image": self._expand_image,
+            "font": self._expand_font,
+        }
         self.properties_dock.tree.sortByColumn(PropertiesColumnText.ATTRIBUTE, Qt.SortOrder.AscendingOrder)
 
         # Allow drag-and-dropping docks into each other
@@ -159,6 +237,13 @@ class MainInspectorWindow(QMainWindow):
         self.webview.setContextMenuPolicy(Qt.ContextMenuPolicy.NoContextMenu)
         self.default_html = "<style>body { background: #003062; }</style>"
         self.webview.setHtml(self.default_html)
+
+        # Page template for rendered UI scripts, split at the font and body placeholders
+        with open(get_resource("inspector.html"), "r", encoding="utf-8") as f:
+            html_head, html_body = f.read().split("/*FONT_PLACEHOLDER*/")
+            html_mid, html_tail = html_body.split("BODY_PLACEHOLDER")
+        self.html_template = (html_head, html_mid, html_tail)
+        self.html_base_url = QUrl.fromLocalFile(get_resource("")) # For the page's scripts and stylesheets
         self.webview_page = self.webview.page() or QWebEnginePage() # 'Or' to satisfy strong type checking
         self.base_layout.addWidget(self.webview)
 
@@ -188,14 +273,14 @@ class MainInspectorWindow(QMainWindow):
             path = sys.argv[1]
             if os.path.exists(path) and os.path.isdir(path):
                 self.discover_files(path)
-                self.load_font_styles(path)
+                self.load_font_styles()
                 self.load_files()
             elif os.path.exists(path):
                 State.file_list = [path]
                 self.load_files()
         elif last_opened_dir and os.path.exists(last_opened_dir) and os.path.isdir(last_opened_dir):
             self.discover_files(last_opened_dir)
-            self.load_font_styles(last_opened_dir)
+            self.load_font_styles()
             self.load_files()
         else:
             self.browse(open_dir=True)
@@ -227,13 +312,13 @@ class MainInspectorWindow(QMainWindow):
         self.menu_file.addAction(self.action_open_pkg)
 
         self.menu_file.addSeparator()
-        self.action_reload = QAction(QIcon.fromTheme("view-refresh"), "&Reload Packages")
+        self.action_reload = QAction(get_icon("view-refresh"), "&Reload Packages")
         self.action_reload.setShortcut(QKeySequence.StandardKey.Refresh)
         self.action_reload.triggered.connect(self.reload_files)
         self.menu_file.addAction(self.action_reload)
 
         self.menu_file.addSeparator()
-        self.action_exit = QAction(QIcon.fromTheme("application-exit"), "&Exit")
+        self.action_exit = QAction(get_icon("application-exit"), "&Exit")
         self.action_exit.setShortcut(QKeySequence.StandardKey.Quit)
         self.action_exit.triggered.connect(self.close)
         self.menu_file.addAction(self.action_exit)
@@ -244,7 +329,7 @@ class MainInspectorWindow(QMainWindow):
         self.menu_bar.addMenu(self.menu_edit)
 
         # ... for UI Script dock
-        self.action_copy_ids = QAction(QIcon.fromTheme("edit-copy"), "Copy Group and Instance ID")
+        self.action_copy_ids = QAction(get_icon("edit-copy"), "Copy Group and Instance ID")
         self.action_copy_ids.setShortcut(QKeySequence.fromString("Ctrl+Shift+C"))
         self.action_copy_ids.triggered.connect(lambda: self._copy_to_clipboard(f"{hex(State.current_group_id)} {hex(State.current_instance_id)}"))
         self.menu_edit.addAction(self.action_copy_ids)
@@ -258,65 +343,65 @@ class MainInspectorWindow(QMainWindow):
         self.menu_edit.addAction(self.action_copy_instance_id)
 
         self.menu_edit.addSeparator()
-        self.action_script_src = QAction(QIcon.fromTheme("format-text-code"), "Show &Original Code")
+        self.action_script_src = QAction(get_icon("format-text-code"), "Show &Original Code")
         self.action_script_src.triggered.connect(self.open_original_code)
         self.menu_edit.addAction(self.action_script_src)
 
-        self.action_script_checksum = QAction(QIcon.fromTheme("edit-copy"), "Copy &Checksum")
-        self.action_script_checksum.triggered.connect(lambda: self._copy_tree_item_to_clipboard(self.uiscript_dock.tree, UIScriptColumnData.CHECKSUM, data=True))
+        self.action_script_checksum = QAction(get_icon("edit-copy"), "Copy &Checksum")
+        self.action_script_checksum.triggered.connect(self.copy_checksum)
         self.menu_edit.addAction(self.action_script_checksum)
 
         # ... for Elements dock
         self.menu_edit.addSeparator()
-        self.action_element_visible = QAction(QIcon.fromTheme("view-visible"), "Show &Element")
+        self.action_element_visible = QAction(get_icon("view-visible"), "Show &Element")
         self.action_element_visible.setCheckable(True)
         self.action_element_visible.setShortcut(QKeySequence.fromString("Ctrl+E"))
         self.action_element_visible.triggered.connect(self.toggle_element_visibility)
         self.menu_edit.addAction(self.action_element_visible)
 
-        self.action_element_ignore = QAction(QIcon.fromTheme("edit-none-symbolic"), "&Ignore Clicks")
+        self.action_element_ignore = QAction(get_icon("edit-none-symbolic"), "&Ignore Clicks")
         self.action_element_ignore.setCheckable(True)
         self.action_element_ignore.setShortcut(QKeySequence.fromString("Ctrl+I"))
         self.action_element_ignore.triggered.connect(self.toggle_element_ignored)
         self.menu_edit.addAction(self.action_element_ignore)
 
-        self.action_parent_element = QAction(QIcon.fromTheme("view-list-tree-symbolic"), "Select &Parent")
+        self.action_parent_element = QAction(get_icon("view-list-tree-symbolic"), "Select &Parent")
         self.action_parent_element.setShortcut(QKeySequence.fromString("Ctrl+P"))
         self.action_parent_element.triggered.connect(self.select_parent_element)
         self.menu_edit.addAction(self.action_parent_element)
 
-        self.action_copy_element_iid = QAction(QIcon.fromTheme("edit-copy"), "Copy &Interface ID")
+        self.action_copy_element_iid = QAction(get_icon("edit-copy"), "Copy &Interface ID")
         self.action_copy_element_iid.triggered.connect(lambda: self._copy_tree_item_to_clipboard(self.elements_dock.tree, ElementsColumnText.ELEMENT))
 
-        self.action_copy_element_caption = QAction(QIcon.fromTheme("edit-copy"), "Copy C&aption")
+        self.action_copy_element_caption = QAction(get_icon("edit-copy"), "Copy C&aption")
         self.action_copy_element_caption.triggered.connect(lambda: self._copy_tree_item_to_clipboard(self.elements_dock.tree, ElementsColumnText.CAPTION))
 
-        self.action_copy_element_id = QAction(QIcon.fromTheme("edit-copy"), "Copy &ID")
+        self.action_copy_element_id = QAction(get_icon("edit-copy"), "Copy &ID")
         self.action_copy_element_id.triggered.connect(lambda: self._copy_tree_item_to_clipboard(self.elements_dock.tree, ElementsColumnText.ID))
 
         # ... for Properties dock
         self.menu_edit.addSeparator()
-        self.action_copy_attribute = QAction(QIcon.fromTheme("edit-copy"), "Copy &Attribute")
+        self.action_copy_attribute = QAction(get_icon("edit-copy"), "Copy &Attribute")
         self.action_copy_attribute.triggered.connect(lambda: self._copy_tree_item_to_clipboard(self.properties_dock.tree, PropertiesColumnText.ATTRIBUTE))
 
-        self.action_copy_value = QAction(QIcon.fromTheme("edit-copy"), "Copy &Value")
+        self.action_copy_value = QAction(get_icon("edit-copy"), "Copy &Value")
         self.action_copy_value.triggered.connect(lambda: self._copy_tree_item_to_clipboard(self.properties_dock.tree, PropertiesColumnText.VALUE))
 
-        self.action_similar_attrib = QAction(QIcon.fromTheme("edit-find"), "Find elements with this &attribute")
+        self.action_similar_attrib = QAction(get_icon("edit-find"), "Find elements with this &attribute")
         self.action_similar_attrib.triggered.connect(lambda: self.open_global_search(True, False))
         self.action_similar_attrib.setDisabled(True)
 
-        self.action_similar_value = QAction(QIcon.fromTheme("edit-find"), "Find elements with this &value")
+        self.action_similar_value = QAction(get_icon("edit-find"), "Find elements with this &value")
         self.action_similar_value.triggered.connect(lambda: self.open_global_search(False, True))
         self.action_similar_value.setDisabled(True)
 
-        self.action_similar_attribvalue = QAction(QIcon.fromTheme("edit-find"), "Find elements with same attribute/value")
+        self.action_similar_attribvalue = QAction(get_icon("edit-find"), "Find elements with same attribute/value")
         self.action_similar_attribvalue.triggered.connect(lambda: self.open_global_search(True, True))
         self.action_similar_attribvalue.setDisabled(True)
 
         # ... Global
         self.menu_edit.addSeparator()
-        self.action_global_search = QAction(QIcon.fromTheme("edit-find"), "&Find References...")
+        self.action_global_search = QAction(get_icon("edit-find"), "&Find References...")
         self.action_global_search.setShortcut(QKeySequence.fromString("Ctrl+Shift+F"))
         self.action_global_search.triggered.connect(self.open_global_search)
         self.menu_edit.addAction(self.action_global_search)
@@ -337,12 +422,12 @@ class MainInspectorWindow(QMainWindow):
 
         self.menu_view.addSeparator()
 
-        self.action_zoom_in = QAction(QIcon.fromTheme("zoom-in"), "Zoom &In")
+        self.action_zoom_in = QAction(get_icon("zoom-in"), "Zoom &In")
         self.action_zoom_in.setShortcut(QKeySequence.StandardKey.ZoomIn)
         self.action_zoom_in.triggered.connect(lambda: self.webview.setZoomFactor(self.webview.zoomFactor() + 0.1))
         self.menu_view.addAction(self.action_zoom_in)
 
-        self.action_zoom_out = QAction(QIcon.fromTheme("zoom-out"), "Zoom &Out")
+        self.action_zoom_out = QAction(get_icon("zoom-out"), "Zoom &Out")
         self.action_zoom_out.setShortcut(QKeySequence.StandardKey.ZoomOut)
         self.action_zoom_out.triggered.connect(lambda: self.webview.setZoomFactor(self.webview.zoomFactor() - 0.1))
         self.menu_view.addAction(self.action_zoom_out)
@@ -350,7 +435,7 @@ class MainInspectorWindow(QMainWindow):
         self.menu_view.addSeparator()
 
         for index, level in enumerate([50, 100, 150, 200]):
-            zoom_action = QAction(QIcon.fromTheme("zoom"), f"Zoom {level}%")
+            zoom_action = QAction(get_icon("zoom"), f"Zoom {level}%")
             zoom_action.triggered.connect(lambda x, level=level: self.webview.setZoomFactor(level / 100))
             zoom_action.setShortcut(QKeySequence.fromString(f"Ctrl+{index + 1}"))
             self.menu_view.addAction(zoom_action)
@@ -359,9 +444,9 @@ class MainInspectorWindow(QMainWindow):
         self.menu_view.addSeparator()
 
         self.debug_menu = QMenu("&Debug Tools")
-        self.debug_menu.setIcon(QIcon.fromTheme("tools"))
+        self.debug_menu.setIcon(get_icon("tools"))
         self.menu_view.addMenu(self.debug_menu)
-        self.action_debug_inspect = QAction(QIcon.fromTheme("tools-symbolic"), "HTML Web Inspector")
+        self.action_debug_inspect = QAction(get_icon("tools-symbolic"), "HTML Web Inspector")
         self.action_debug_inspect.triggered.connect(self.open_web_dev_tools)
         self.debug_menu.addAction(self.action_debug_inspect)
 
@@ -369,20 +454,20 @@ class MainInspectorWindow(QMainWindow):
         self.menu_help = QMenu("&Help")
         self.menu_bar.addMenu(self.menu_help)
 
-        self.action_online = QAction(QIcon.fromTheme("globe"), "View on &GitHub")
-        self.action_online.triggered.connect(lambda: webbrowser.open(PROJECT_URL))
+        self.action_online = QAction(get_icon("globe"), "View on &GitHub")
+        self.action_online.triggered.connect(lambda: QDesktopServices.openUrl(QUrl(PROJECT_URL)))
         self.menu_help.addAction(self.action_online)
 
-        self.action_releases = QAction(QIcon.fromTheme("globe"), "View &Releases")
-        self.action_releases.triggered.connect(lambda: webbrowser.open(f"{PROJECT_URL}/releases"))
+        self.action_releases = QAction(get_icon("globe"), "View &Releases")
+        self.action_releases.triggered.connect(lambda: QDesktopServices.openUrl(QUrl(f"{PROJECT_URL}/releases")))
         self.menu_help.addAction(self.action_releases)
 
         self.menu_help.addSeparator()
-        self.action_about_qt = QAction(QIcon.fromTheme("qtcreator"), "About &Qt")
+        self.action_about_qt = QAction(get_icon("qtcreator"), "About &Qt")
         self.action_about_qt.triggered.connect(lambda: QMessageBox.aboutQt(self))
         self.menu_help.addAction(self.action_about_qt)
 
-        self.action_about_app = QAction(QIcon.fromTheme("help-about"), "&About S2UI Inspector")
+        self.action_about_app = QAction(get_icon("help-about"), "&About S2UI Inspector")
         self.action_about_app.triggered.connect(lambda: QMessageBox.about(self, "About S2UI Inspector", f"S2UI Inspector v{VERSION}\n{PROJECT_URL}\n\nA fan-made graphical user interface viewer for The Sims 2."))
         self.menu_help.addAction(self.action_about_app)
 
@@ -397,14 +482,27 @@ class MainInspectorWindow(QMainWindow):
         else:
             self.status_bar.showMessage("Unable to copy to clipboard")
 
-    def _copy_tree_item_to_clipboard(self, tree: QTreeWidget, column: int, data=False):
+    def _copy_tree_item_to_clipboard(self, tree: QTreeWidget, column: int):
         """Copy the selected item's text to the clipboard"""
         item = tree.currentItem()
-        if item and data:
-            self._copy_to_clipboard(item.data(column, Qt.ItemDataRole.UserRole))
-        elif item:
+        if item:
             self._copy_to_clipboard(item.text(column))
 
+    def copy_checksum(self):
+        """Copy the selected UI script's checksum, calculating it if it was skipped when loading"""
+        item = self.uiscript_dock.tree.currentItem()
+        if not item:
+            return
+
+        checksum: str = item.data(UIScriptColumnData.CHECKSUM, Qt.ItemDataRole.UserRole)
+        index: int|None = item.data(UIScriptColumnData.ENTRY_INDEX, Qt.ItemDataRole.UserRole)
+        if not checksum and index is not None:
+            checksum = get_checksum(State.uiscript_entries[index])
+            item.setData(UIScriptColumnData.CHECKSUM, Qt.ItemDataRole.UserRole, checksum)
+
+        if checksum:
+            self._copy_to_clipboard(checksum)
+
     def browse(self, open_dir: bool):
         """
         Show the file/folder dialog to select a package file.
@@ -427,7 +525,7 @@ class MainInspectorWindow(QMainWindow):
             if open_dir:
                 path = browser.selectedFiles()[0]
                 self.discover_files(path)
-                self.load_font_styles(path)
+                self.load_font_styles()
             else:
                 State.file_list = browser.selectedFiles()
 
@@ -448,6 +546,14 @@ class MainInspectorWindow(QMainWindow):
         self.action_global_search.setEnabled(True)
 
         State.graphics = {}
+        State.uiscript_entries = []
+        State.uiscripts = {}
+        State.element_items = {}
+        self.uiscript_html = {}
+        self.uiscript_sources = {}
+        self.thumbnails.clear()
+        self.captions.clear()
+        self.bridge.clear_cache()
         State.current_group_id = 0x0
         State.current_instance_id = 0x0
         State.game_dir = ""
@@ -458,41 +564,51 @@ class MainInspectorWindow(QMainWindow):
     def discover_files(self, path: str):
         """
         Gather a file list of packages containing UI scripts in a game directory.
+        Font styles are found in the same scan, ready for load_font_styles().
         """
         self.status_bar.showMessage(f"Discovering files: {path}")
         QApplication.processEvents()
-        State.file_list = []
-        for filename in ["TSData/Res/UI/ui.package", "TSData/Res/UI/CaSIEUI.data"]:
-            State.file_list += glob.glob(f"{path}/**/{filename}", recursive=True)
+        found = find_files(path, ["ui.package", "CaSIEUI.data", "FontStyle.ini"])
 
-        if not State.file_list:
-            for filename in ["ui.package", "CaSIEUI.data"]:
-                State.file_list += glob.glob(f"{path}/**/{filename}", recursive=True)
+        # Paths are compared with normcase, so they're case insensitive on Windows like the game
+        font_style = os.path.normcase("FontStyle.ini")
+        fonts_dir = os.path.normcase(os.path.join("Res", "UI", "Fonts"))
+        font_style_paths = [filename for filename in found if os.path.normcase(os.path.basename(filename)) == font_style]
+        self.font_style_paths = [filename for filename in font_style_paths if os.path.normcase(os.path.dirname(filename)).endswith(fonts_dir)]
+        found = [filename for filename in found if filename not in font_style_paths]
+
+        # Prefer packages inside game installations, otherwise any found will do
+        suffix = os.path.normcase(os.path.join("TSData", "Res", "UI"))
+        State.file_list = [filename for filename in found if os.path.normcase(os.path.dirname(filename)).endswith(suffix)] or found
 
         if State.file_list:
             self.config.set_last_opened_dir(path)
             State.game_dir = path
 
-    def load_font_styles(self, path: str):
+    def load_font_styles(self):
         """
-        Locate the game containing font files and load the larger FontStyle.ini.
+        Load the larger FontStyle.ini from the games found by discover_files().
         The base game contains this, but the University expansion is known to
         provide an updated version of the file.
         """
         ini_path = ""
         ini_size = 0
 
-        for prefix in glob.glob(f"{path}/**/Res/UI/Fonts/", recursive=True):
-            _ini_path = os.path.join(prefix, "FontStyle.ini")
+        for _ini_path in self.font_style_paths:
+            try:
+                _ini_size = os.path.getsize(_ini_path)
+            except OSError:
+                continue
 
-            if os.path.exists(_ini_path) and os.path.getsize(_ini_path) > ini_size:
+            if _ini_size > ini_size:
                 ini_path = _ini_path
-                ini_size = os.path.getsize(_ini_path)
+                ini_size = _ini_size
 
         if not ini_path:
             return QMessageBox.warning(self, "Couldn't load fonts", "FontStyle.ini was not found in this installation. Fonts may not load properly.")
 
         self.fonts = s2ui.fontstyles.parse_font_styles(ini_path)
+        self.fonts_css = s2ui.fontstyles.get_stylesheet(self.fonts)
 
     def load_files(self):
         """
@@ -521,44 +637,60 @@ class MainInspectorWindow(QMainWindow):
         QApplication.processEvents()
 
         # Map identical group and instance IDs to the game(s) and package(s) that use them
-        class _File:
-            def __init__(self, entry: dbpf.Entry, package: str, game: str):
-                self.entry = entry
-                self.package = package
-                self.game = game
-
-        files: dict[tuple, dict[str, list[_File]]] = {}     # (group_id, instance_id): {checksum: [File, File, ...], ...}
+        copies: dict[tuple, list[UIScriptFile]] = {}                # (group_id, instance_id): [File, File, ...]
+        files: dict[tuple, dict[str, list[UIScriptFile]]] = {}     # (group_id, instance_id): {checksum: [File, File, ...], ...}
         found_games = set()
 
         for package_path in State.file_list:
             package = dbpf.DBPF(package_path)
-            package_name = os.path.basename(package_path)
-            game_name = package.game_name
+            package_name = sys.intern(os.path.basename(package_path))
+            game_name = sys.intern(package.game_name)
             found_games.add(game_name)
 
-            # Create lookup of graphics by group and instance ID
-            for entry in package.get_entries_by_type(dbpf.TYPE_IMAGE):
-                State.graphics[(entry.group_id, entry.instance_id)] = entry
-
-            # Create list of each instance of UI files
-            for entry in package.get_entries_by_type(dbpf.TYPE_UI_DATA):
-                key = (entry.group_id, entry.instance_id)
-                if key not in files:
-                    files[key] = {}
-
-                if entry.decompressed_size > 1024 * 1024:
-                    checksum = "Binary data"
-                else:
+            # Sort entries in one pass: graphics are looked up by group and instance ID,
+            # while each copy of a UI script is listed
+            graphics: dict[tuple, dbpf.Entry] = {}
+            for entry in package.entries:
+                if entry.type_id == dbpf.TYPE_IMAGE:
+                    graphics[(entry.group_id, entry.instance_id)] = entry
+
+                elif entry.type_id == dbpf.TYPE_UI_DATA:
+                    key = (entry.group_id, entry.instance_id)
+                    if key not in copies:
+                        copies[key] = []
+                    copies[key].append(UIScriptFile(entry, package_name, game_name))
+
+            State.graphics.update(graphics)
+
+        # Checksums only tell copies apart, so skip them when there's just one
+        duplicates: list[UIScriptFile] = []
+        for key, file_list in copies.items():
+            if len(file_list) == 1:
+                files[key] = {"": file_list}
+            else:
+                files[key] = {}
+                duplicates.extend(file_list)
+
+        # Packages are read and decompressed on this thread, as they're not safe to read
+        # from multiple threads, but the data is hashed across all cores
+        pending: list[concurrent.futures.Future|str] = [] # Future for the checksum, or the reason there isn't one
+        if duplicates:
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                for file in duplicates:
+                    if file.entry.decompressed_size > 1024 * 1024:
+                        pending.append("Binary data")
+                        continue
                     try:
-                        checksum = hashlib.md5(entry.data_safe).hexdigest()
+                        pending.append(executor.submit(get_data_checksum, file.entry.data_safe))
                     except dbpf.errors.ArrayTooSmall:
-                        checksum = "Compression error"
+                        pending.append("Compression error")
 
-                if checksum not in files[key]:
-                    files[key][checksum] = []
-
-                file = _File(entry, package_name, game_name)
-                files[key][checksum].append(file)
+        for file, result in zip(duplicates, pending):
+            checksum = result if isinstance(result, str) else result.result()
+            key = (file.entry.group_id, file.entry.instance_id)
+            if checksum not in files[key]:
+                files[key][checksum] = []
+            files[key][checksum].append(file)
 
         self.status_bar.showMessage("Populating file tree...")
         QApplication.processEvents()
@@ -579,31 +711,51 @@ class MainInspectorWindow(QMainWindow):
         def _get_package_label(packages: list):
             return f"{len(packages)} packages" if len(packages) > 1 else packages[0]
 
+        # Many UI scripts share the same group ID, games and packages, so reuse the same strings
+        group_ids: dict[int, str] = {}
+
+        def _get_tooltip(names: list) -> str:
+            return sys.intern("\n".join(names))
+
         # Create tree for each unique instance of UI scripts
+        # Items are built detached, then added to the (sorted) tree in one go
+        top_level_items: list[QTreeWidgetItem] = []
         for (group_id, instance_id), checksums in files.items():
+            if group_id not in group_ids:
+                group_ids[group_id] = sys.intern(hex(group_id))
+            group_id_hex = group_ids[group_id]
+            instance_id_hex = hex(instance_id)
             children = []
-            package_names: list[str] = []
-            game_names: list[str] = []
+            package_names: set[str] = set()
+            game_names: set[str] = set()
             only_one = len(checksums) == 1
 
             for checksum, file_list in checksums.items():
-                this_package_names = sorted(set(file.package for file in file_list))
-                this_game_names = sorted(set(file.game for file in file_list))
-                package_names.extend(this_package_names)
-                game_names.extend(this_game_names)
+                this_package_names = {file.package for file in file_list}
+                this_game_names = {file.game for file in file_list}
+                package_names.update(this_package_names)
+                game_names.update(this_game_names)
+                sorted_package_names = sorted(this_package_names)
+                sorted_game_names = sorted(this_game_names)
                 entry = file_list[0].entry
+                index = len(State.uiscript_entries)
+                State.uiscript_entries.append(entry)
 
-                item = QTreeWidgetItem([hex(group_id), hex(instance_id), "", _get_name_label(this_game_names), _get_package_label(this_package_names)])
-                item.setToolTip(UIScriptColumnText.GAME, "\n".join(this_game_names))
-                item.setToolTip(UIScriptColumnText.PACKAGE, "\n".join(this_package_names))
-                item.setData(UIScriptColumnData.DBPF_ENTRY, Qt.ItemDataRole.UserRole, entry)
+                # Highlight the latest installation for this UI script
+                is_latest = not only_one and bool(latest_game_name) and latest_game_name in this_game_names
+                game_label = _get_name_label(sorted_game_names)
+                if is_latest:
+                    game_label = f"{game_label} / Latest"
+
+                item = QTreeWidgetItem([group_id_hex, instance_id_hex, "", game_label, _get_package_label(sorted_package_names)])
+                item.setToolTip(UIScriptColumnText.GAME, _get_tooltip(sorted_game_names))
+                item.setToolTip(UIScriptColumnText.PACKAGE, _get_tooltip(sorted_package_names))
+                item.setData(UIScriptColumnData.ENTRY_INDEX, Qt.ItemDataRole.UserRole, index)
                 item.setData(UIScriptColumnData.CHECKSUM, Qt.ItemDataRole.UserRole, checksum)
 
-                # Highlight the latest installation for this UI script
-                if not only_one and latest_game_name and latest_game_name in this_game_names:
+                if is_latest:
                     for col in range(0, item.columnCount()):
                         item.setForeground(col, QColor(Qt.GlobalColor.cyan))
-                    item.setText(UIScriptColumnText.GAME, f"{item.text(UIScriptColumnText.GAME)} / Latest")
 
                 error_column_ids = [UIScriptColumnText.GROUP_ID, UIScriptColumnText.INSTANCE_ID]
 
@@ -614,8 +766,7 @@ class MainInspectorWindow(QMainWindow):
                         item.setToolTip(col, "Cannot read file")
                 else:
                     try:
-                        data = uiscript.serialize_uiscript(entry.data.decode("utf-8"))
-                        item.setData(UIScriptColumnData.UISCRIPT_ROOT, Qt.ItemDataRole.UserRole, data)
+                        State.uiscripts[index] = uiscript.serialize_uiscript(entry.data.decode("utf-8"))
                     except (ValueError, UnicodeDecodeError, dbpf.errors.ArrayTooSmall):
                         item.setDisabled(True)
                         for col in error_column_ids:
@@ -625,19 +776,21 @@ class MainInspectorWindow(QMainWindow):
                 children.append(item)
 
             if only_one:
-                self.uiscript_dock.tree.addTopLevelItems(children)
+                top_level_items.append(children[0])
                 self.preload_items.append(children[0])
                 continue
 
-            game_names = sorted(set(game_names))
-            package_names = sorted(set(package_names))
-            parent = QTreeWidgetItem([hex(group_id), hex(instance_id), "", _get_name_label(game_names), _get_package_label(package_names)])
-            parent.setToolTip(UIScriptColumnText.GAME, "\n".join(game_names))
-            parent.setToolTip(UIScriptColumnText.PACKAGE, "\n".join(package_names))
-            for child in children:
-                parent.addChild(child)
-                self.preload_items.append(child)
-            self.uiscript_dock.tree.addTopLevelItem(parent)
+            sorted_game_names = sorted(game_names)
+            sorted_package_names = sorted(package_names)
+            parent = QTreeWidgetItem([group_id_hex, instance_id_hex, "", _get_name_label(sorted_game_names), _get_package_label(sorted_package_names)])
+            parent.setToolTip(UIScriptColumnText.GAME, _get_tooltip(sorted_game_names))
+            parent.setToolTip(UIScriptColumnText.PACKAGE, _get_tooltip(sorted_package_names))
+            parent.addChildren(children)
+            self.preload_items.extend(children)
+            top_level_items.append(parent)
+
+        with s2ui.widgets.batch_changes(self.uiscript_dock.tree) as tree:
+            tree.addTopLevelItems(top_level_items)
 
         self.status_bar.showMessage(f"Loaded {len(self.preload_items)} UI scripts", 3000)
         self.setCursor(Qt.CursorShape.ArrowCursor)
@@ -656,32 +809,32 @@ class MainInspectorWindow(QMainWindow):
         self.webview.setHtml(self.default_html)
         self.load_files()
         if State.game_dir:
-            self.load_font_styles(State.game_dir)
+            self.load_font_styles()
 
     def _uiscript_to_html(self, root: uiscript.UIScriptRoot) -> str:
         """
         Render UI Script files into HTML for the webview.
         UI Scripts are XML-like formats with (mostly) unquoted attribute values.
         """
-        def _process_line(element: uiscript.UIScriptElement) -> str:
-            parts = ["<div class=\"LEGACY\""]
-            for key, value in element.attributes.items():
-                if not key == "id":
-                    parts.append(f"{key}=\"{value}\"")
-
-            s2ui_element_id = get_s2ui_element_id(element)
-            parts.append(f"id=\"{s2ui_element_id}\"")
-            parts.append(">")
+        # Fragments for the whole script are collected into one list and joined once,
+        # rather than joining each element's string again into its parent's
+        parts: list[str] = []
+
+        def _process_line(element: uiscript.UIScriptElement):
+            parts.append("<div class=\"LEGACY\" ")
+            parts.extend([f"{key}=\"{value}\" " for key, value in element.attributes.items() if key != "id"])
+            parts.append(f"id=\"{get_s2ui_element_id(element)}\" > ")
             for child in element.children:
-                parts.append(_process_line(child))
+                _process_line(child)
+                parts.append(" ")
             parts.append("</div>")
-            return " ".join(parts)
 
-        lines = []
-        for element in root.children:
-            lines.append(_process_line(element))
+        for index, element in enumerate(root.children):
+            if index:
+                parts.append("\n")
+            _process_line(element)
 
-        return "\n".join(lines)
+        return "".join(parts)
 
     def inspect_ui_file(self, item: QTreeWidgetItem):
         """
@@ -690,89 +843,75 @@ class MainInspectorWindow(QMainWindow):
         if not item:
             return
 
-        entry: dbpf.Entry = item.data(UIScriptColumnData.DBPF_ENTRY, Qt.ItemDataRole.UserRole)
-        data: uiscript.UIScriptRoot = item.data(UIScriptColumnData.UISCRIPT_ROOT, Qt.ItemDataRole.UserRole)
+        index: int|None = item.data(UIScriptColumnData.ENTRY_INDEX, Qt.ItemDataRole.UserRole)
 
-        if not data:
+        if index is None:
             # Group item, select first child instead
             item.setExpanded(True)
             child = item.child(0)
             self.uiscript_dock.tree.setCurrentItem(child)
             return
 
+        entry = State.uiscript_entries[index]
+        data = State.uiscripts.get(index)
+        if not data:
+            return
+
         State.current_group_id = entry.group_id
         State.current_instance_id = entry.instance_id
 
+        self.thumbnails.forget_items()
+        State.element_items = {}
         self.elements_dock.tree.clear()
         self.properties_dock.tree.clear()
 
-        # Render the UI into HTML
-        html = self._uiscript_to_html(data)
-        with open(get_resource("inspector.html"), "r", encoding="utf-8") as f:
-            html = f.read().replace("BODY_PLACEHOLDER", html)
-        html = html.replace("/*FONT_PLACEHOLDER*/", s2ui.fontstyles.get_stylesheet(self.fonts))
-        self.webview.setHtml(html, baseUrl=QUrl.fromLocalFile(get_resource("")))
+        # Render the UI into HTML (the same script may be selected again later)
+        body = self.uiscript_html.get(index)
+        if body is None:
+            body = self._uiscript_to_html(data)
+            self.uiscript_html[index] = body
+
+        html_head, html_mid, html_tail = self.html_template
+        html = "".join([html_head, self.fonts_css, html_mid, body, html_tail])
+        self.webview.setHtml(html, baseUrl=self.html_base_url)
 
         # Update the elements and properties dock
-        def _process_element(element: uiscript.UIScriptElement, parent: QTreeWidget|QTreeWidgetItem):
-            iid = element.attributes.get("iid", "Unknown")
-            caption = element.attributes.get("caption", "")
-            element_id = element.attributes.get("id", "")
-            area = element.attributes.get("area", "(0,0,0,0)")
-            image_attr = element.attributes.get("image", "")
+        # Items are built detached from the tree, so it is only notified once of the new items
+        def _process_element(element: uiscript.UIScriptElement) -> QTreeWidgetItem:
+            get_attr = element.attributes.get
+            iid = get_attr("iid", "Unknown")
+            caption = get_attr("caption", "")
+            element_id = get_attr("id", "")
+            image_attr = get_attr("image", "")
 
             assert isinstance(iid, str)
             assert isinstance(caption, str)
             assert isinstance(element_id, str)
-            assert isinstance(area, str)
             assert isinstance(image_attr, str)
 
-            item = QTreeWidgetItem(parent, [iid, "", "", caption, element_id])
+            s2ui_id = get_s2ui_element_id(element)
+            item = QTreeWidgetItem([iid, "", "", caption, element_id])
             item.setData(ElementsColumnData.UISCRIPT_ELEMENT, Qt.ItemDataRole.UserRole, element)
-            item.setData(ElementsColumnData.ELEMENT_ID_S2UI, Qt.ItemDataRole.UserRole, get_s2ui_element_id(element))
+            item.setData(ElementsColumnData.ELEMENT_ID_S2UI, Qt.ItemDataRole.UserRole, s2ui_id)
+            State.element_items[s2ui_id] = item
             item.setToolTip(ElementsColumnText.CAPTION, caption)
             item.setToolTip(ElementsColumnText.ID, element_id)
             item.setCheckState(ElementsColumnText.SHOWN, Qt.CheckState.Checked)
             item.setCheckState(ElementsColumnText.IGNORE, Qt.CheckState.Unchecked)
 
             if image_attr:
-                png = get_image_as_png(image_attr)
-                if png is None:
-                    pixmap = QPixmap(16, 16)
-                    pixmap.fill(Qt.GlobalColor.red)
-                    item.setToolTip(ElementsColumnText.ELEMENT, f"Missing bitmap: {image_attr}")
-                    item.setForeground(ElementsColumnText.ELEMENT, Qt.GlobalColor.red)
-                else:
-                    png_data = png.getvalue()
-                    pixmap = QPixmap()
-                    pixmap.loadFromData(png_data)
-
-                    # For buttons, crop to the second 1/4 (normal state)
-                    if iid == "IGZWinBtn":
-                        quarter = pixmap.width() // 4
-                        pixmap = QPixmap.fromImage(QImage.fromData(png_data).copy(quarter, 0, quarter, pixmap.height()))
-
-                # Scale to square aspect ratio (16x16) for uniformity
-                scaled_pixmap = pixmap.scaled(16, 16, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                square_pixmap = QPixmap(16, 16)
-                square_pixmap.fill(Qt.GlobalColor.transparent)
-                painter = QPainter(square_pixmap)
-                x = (16 - scaled_pixmap.width()) // 2
-                y = (16 - scaled_pixmap.height()) // 2
-                painter.drawPixmap(x, y, scaled_pixmap)
-                painter.end()
-                item.setIcon(0, QIcon(square_pixmap))
-
-            for child in element.children:
-                _process_element(child, item)
+                self.thumbnails.set_icon(item, image_attr, iid == "IGZWinBtn")
 
+            item.addChildren([_process_element(child) for child in element.children])
             return item
 
-        for element in data.children:
-            _process_element(element, self.elements_dock.tree)
+        with s2ui.widgets.batch_changes(self.elements_dock.tree) as tree:
+            tree.addTopLevelItems([_process_element(element) for element in data.children])
+
+            tree.expandAll()
 
-        self.elements_dock.tree.expandAll()
-        self.elements_dock.tree.resizeColumnToContents(3)
+        # Measuring every caption can wait until the tree has been painted
+        QTimer.singleShot(0, lambda: self.elements_dock.tree.resizeColumnToContents(ElementsColumnText.CAPTION))
 
         if self.elements_dock.filter.is_filtered():
             self.elements_dock.filter.refresh_tree()
@@ -791,8 +930,9 @@ class MainInspectorWindow(QMainWindow):
         if not item:
             return
 
-        element_id: str = item.data(ElementsColumnData.ELEMENT_ID_S2UI, Qt.ItemDataRole.UserRole)
-        self.webview_page.runJavaScript(f"hoverElement('{element_id}')")
+        self.hovered_element_id = item.data(ElementsColumnData.ELEMENT_ID_S2UI, Qt.ItemDataRole.UserRole)
+        if not self.hover_timer.isActive():
+            self.hover_timer.start()
 
     def inspect_element(self, item: QTreeWidgetItem):
         """
@@ -814,113 +954,101 @@ class MainInspectorWindow(QMainWindow):
 
         self.properties_dock.tree.clear()
 
-        def _add_property(key: str, value: str, has_duplicates: bool):
-            prop = QTreeWidgetItem(self.properties_dock.tree, [key, value])
+        # Items are built detached from the tree, then added together
+        def _add_property(key: str, value: str, has_duplicates: bool) -> QTreeWidgetItem:
+            prop = QTreeWidgetItem([key, value])
             prop.setToolTip(1, value)
 
             # Expanded attributes
-            match key:
-                case "area":
-                    x, y, width, height = value[1:-1].split(",")
-                    for name, value in [("X", x), ("Y", y), ("Width", width), ("Height", height)]:
-                        QTreeWidgetItem(prop, [name, value])
-                case "image":
-                    image_attr = element.attributes.get("image", "")
-                    assert isinstance(image_attr, str)
-                    if image_attr:
-                        _group_id, _instance_id = image_attr[1:-1].split(",")
-                        group_id = int(_group_id, 16)
-                        instance_id = int(_instance_id, 16)
-                        subprop1 = QTreeWidgetItem(prop, ["Group ID", hex(group_id)])
-                        subprop2 = QTreeWidgetItem(prop, ["Instance ID", hex(instance_id)])
-                        if (group_id, instance_id) not in State.graphics:
-                            for i in [prop, subprop1, subprop2]:
-                                for c in range(0, i.columnCount()):
-                                    i.setToolTip(1, "Missing bitmap")
-                                    i.setForeground(c, Qt.GlobalColor.red)
-                case "font":
-                    style_name = element.attributes.get("font", "")
-                    assert isinstance(style_name, str)
-                    font_style = self.fonts.get(style_name)
-                    if font_style:
-                        QTreeWidgetItem(prop, ["Font Face", font_style.font_face])
-                        QTreeWidgetItem(prop, ["Font Size", str(font_style.size)])
-                        QTreeWidgetItem(prop, ["Bold", "Yes" if font_style.bold else "No"])
-                        QTreeWidgetItem(prop, ["Underline", "Yes" if font_style.underline else "No"])
-                        QTreeWidgetItem(prop, ["Line Spacing", str(font_style.line_spacing)])
-                        QTreeWidgetItem(prop, ["Antialiasing Mode", font_style.antialiasing_mode])
-                        QTreeWidgetItem(prop, ["Horizontal Scaling", str(font_style.xscale)])
-
-            if key.find("color") != -1 and len(value.split(",")) == 3: # (R, G, B)
-                _color = value[1:-1].split(",")
-                pixmap = QPixmap(16, 16)
-                pixmap.fill(QColor.fromRgb(int(_color[0]), int(_color[1]), int(_color[2])))
-                prop.setIcon(1, QIcon(pixmap))
+            handler = self.property_handlers.get(key)
+            if handler:
+                handler(prop, value)
+
+            if "color" in key:
+                rgb = RGB_PATTERN.match(value)
+                if rgb:
+                    pixmap = QPixmap(16, 16)
+                    pixmap.fill(QColor.fromRgb(*map(int, rgb.groups())))
+                    prop.setIcon(1, QIcon(pixmap))
 
             if has_duplicates:
                 for c in range(0, prop.columnCount()):
                     prop.setForeground(c, Qt.GlobalColor.yellow)
 
-            prop.setExpanded(True)
+            return prop
 
+        props: list[QTreeWidgetItem] = []
         for key, value in element.attributes.items():
             if isinstance(value, str):
-                _add_property(key, value, False)
+                props.append(_add_property(key, value, False))
             elif isinstance(value, list):
                 for v in value:
-                    _add_property(key, v, True)
+                    props.append(_add_property(key, v, True))
+
+        with s2ui.widgets.batch_changes(self.properties_dock.tree) as tree:
+            tree.addTopLevelItems(props)
+            tree.expandAll()
 
         if self.properties_dock.filter.is_filtered():
             self.properties_dock.filter.refresh_tree()
 
-    def preload_files(self):
+    def _expand_area(self, prop: QTreeWidgetItem, value: str):
         """
-        Continue loading files in the background to identify captions.
+        Break down an element's position and size in the properties dock.
         """
-        self.action_reload.setEnabled(False)
-        while self.preload_items:
-            item = self.preload_items.pop(0)
-            entry: dbpf.Entry = item.data(UIScriptColumnData.DBPF_ENTRY, Qt.ItemDataRole.UserRole)
-            data: uiscript.UIScriptRoot = item.data(UIScriptColumnData.UISCRIPT_ROOT, Qt.ItemDataRole.UserRole)
-
-            if entry.decompressed_size > 1024 * 1024:
-                item.setText(UIScriptColumnText.CAPTION, "Binary data")
-                item.setDisabled(True)
-                continue
+        area = AREA_PATTERN.match(value)
+        if area:
+            for name, number in zip(["X", "Y", "Width", "Height"], area.groups()):
+                QTreeWidgetItem(prop, [name, number])
 
-            if not data:
-                continue
-
-            # Try finding elements with user-facing captions
-            matches = []
-            for iid in ["IGZWinText", "IGZWinTextEdit", "IGZWinBtn", "IGZWinFlatRect", "IGZWinBMP", "IGZWinGen"]:
-                elements = data.get_elements_by_attribute("iid", iid)
-                for element in elements:
-                    caption = element.attributes.get("caption", "")
-                    if isinstance(caption, str):
-                        matches.append(caption)
-
-                # Exclude captions used for technical key/value data
-                # e.g. Ignore lowercase text, and things like "kCollapsedRows=1"
-                matches = [match.replace("\\r\\n", " ") for match in matches if (not match.find("=") != -1 and not match.isupper()) and not match.islower() and match != ""]
-
-                if matches:
-                    break
-
-            if matches:
-                column_id = UIScriptColumnText.CAPTION
+    def _expand_image(self, prop: QTreeWidgetItem, value: str):
+        """
+        Show the IDs of an element's image in the properties dock, and whether it is missing.
+        """
+        if not value:
+            return
 
-                # Use first found caption as the hint
-                item.setText(column_id, matches[0])
-                item.setToolTip(column_id, "\n".join(matches))
+        _group_id, _instance_id = value[1:-1].split(",")
+        group_id = int(_group_id, 16)
+        instance_id = int(_instance_id, 16)
+        subprop1 = QTreeWidgetItem(prop, ["Group ID", hex(group_id)])
+        subprop2 = QTreeWidgetItem(prop, ["Instance ID", hex(instance_id)])
+        if (group_id, instance_id) not in State.graphics:
+            for i in [prop, subprop1, subprop2]:
+                for c in range(0, i.columnCount()):
+                    i.setToolTip(1, "Missing bitmap")
+                    i.setForeground(c, Qt.GlobalColor.red)
+
+    def _expand_font(self, prop: QTreeWidgetItem, value: str):
+        """
+        Show the details of an element's font style in the properties dock.
+        """
+        font_style = self.fonts.get(value)
+        if font_style:
+            QTreeWidgetItem(prop, ["Font Face", font_style.font_face])
+            QTreeWidgetItem(prop, ["Font Size", str(font_style.size)])
+            QTreeWidgetItem(prop, ["Bold", "Yes" if font_style.bold else "No"])
+            QTreeWidgetItem(prop, ["Underline", "Yes" if font_style.underline else "No"])
+            QTreeWidgetItem(prop, ["Line Spacing", str(font_style.line_spacing)])
+            QTreeWidgetItem(prop, ["Antialiasing Mode", font_style.antialiasing_mode])
+            QTreeWidgetItem(prop, ["Horizontal Scaling", str(font_style.xscale)])
 
-                # For grouped items, update the parent
-                parent = item.parent()
-                if parent:
-                    parent.setText(column_id, max(matches, key=len))
-                    parent.setToolTip(column_id, "\n".join(matches))
+    def preload_files(self):
+        """
+        Continue loading files in the background to identify captions.
+        """
+        # Reload is enabled again once every search has finished, including any still running
+        self.action_reload.setEnabled(False)
+        self.captions.start(self.preload_items)
+        self.preload_items = []
 
+    def _captions_finished(self):
+        """
+        All captions were found. Allow reloading again, and filter by the new captions.
+        """
         self.action_reload.setEnabled(True)
+        if self.uiscript_dock.filter.is_filtered():
+            self.uiscript_dock.filter.refresh_tree()
 
     def open_original_code(self):
         """
@@ -930,10 +1058,11 @@ class MainInspectorWindow(QMainWindow):
         if not item:
             return
 
-        entry: dbpf.Entry = item.data(UIScriptColumnData.DBPF_ENTRY, Qt.ItemDataRole.UserRole)
-        if not entry:
+        index: int|None = item.data(UIScriptColumnData.ENTRY_INDEX, Qt.ItemDataRole.UserRole)
+        if index is None:
             return
 
+        entry = State.uiscript_entries[index]
         dialog = QDialog(self)
         dialog.setWindowTitle(f"Source Code for Group ID {hex(State.current_group_id)}, Instance ID {hex(State.current_instance_id)}")
 
@@ -941,11 +1070,31 @@ class MainInspectorWindow(QMainWindow):
         layout.setContentsMargins(0, 0, 0, 0)
         dialog.setLayout(layout)
 
-        code = QTextEdit(dialog)
-        code.setPlainText(entry.data.decode("utf-8"))
+        code = QPlainTextEdit(dialog)
         code.setReadOnly(True)
+        code.setUndoRedoEnabled(False)
         code.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
 
+        # Large scripts are added a portion at a time, so the dialog can open straight away
+        source = self.uiscript_sources.get(index)
+        if source is None:
+            source = self.uiscript_sources[index] = entry.data.decode("utf-8")
+        lines = source.splitlines()
+        chunk_size = 2000
+
+        def _append_lines(start: int):
+            if start and not dialog.isVisible():
+                return
+            text = "\n".join(lines[start:start + chunk_size])
+            if start == 0:
+                code.setPlainText(text)
+            else:
+                code.appendPlainText(text)
+            if start + chunk_size < len(lines):
+                QTimer.singleShot(0, lambda: _append_lines(start + chunk_size))
+
+        _append_lines(0)
+
         buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
         buttons.rejected.connect(dialog.reject)
 
@@ -961,31 +1110,27 @@ class MainInspectorWindow(QMainWindow):
         Open the web inspector for debugging this application.
         This is a one-way action. Place the web inspector tools into the main window.
         """
+        # Building another web view takes a moment, so let the menu close first
+        self.action_debug_inspect.setDisabled(True)
+        QTimer.singleShot(0, self._attach_web_dev_tools)
+
+    def _attach_web_dev_tools(self):
+        """
+        Create the web inspector and place it beside the renderer.
+        """
         # pylint: disable=attribute-defined-outside-init
-        self._webview = QWidget()
-        self._webview_layout = QHBoxLayout()
-        self._webview_layout.setContentsMargins(0, 0, 0, 0)
-        self._webview.setLayout(self._webview_layout)
-        self._webview_layout.addWidget(self.webview)
-
-        self._inspector = QWidget()
-        self._inspector_layout = QHBoxLayout()
-        self._inspector_layout.setContentsMargins(0, 0, 0, 0)
-        self._inspector.setLayout(self._inspector_layout)
-        self.inspector = QWebEngineView(self._inspector)
-        self._inspector_layout.addWidget(self.inspector)
-        self.inspector.setContextMenuPolicy(Qt.ContextMenuPolicy.DefaultContextMenu)
+        self.inspector = QWebEngineView()
         inspector_page = self.inspector.page()
         if inspector_page:
             inspector_page.setInspectedPage(self.webview_page)
 
+        # The splitter lays out the web views directly, moving the renderer from the main layout
         self.web_splitter = QSplitter(Qt.Orientation.Horizontal)
-        self.web_splitter.addWidget(self._webview)
-        self.web_splitter.addWidget(self._inspector)
+        self.web_splitter.addWidget(self.webview)
+        self.web_splitter.addWidget(self.inspector)
         self.web_splitter.setSizes([1000, 500])
 
         self.base_layout.addWidget(self.web_splitter)
-        self.action_debug_inspect.setDisabled(True)
 
     def toggle_element_visibility(self):
         """
@@ -1019,18 +1164,29 @@ class MainInspectorWindow(QMainWindow):
             self.webview_page.runJavaScript(f"hideElement('{element_id}')")
 
         # De-emphasise the text and descendants
-        for child in [item] + s2ui.widgets.iterate_children(item):
-            _seen = [child.checkState(ElementsColumnText.SHOWN) == Qt.CheckState.Checked]
-            parent = child.parent()
-            while parent:
-                _seen.append(parent.checkState(ElementsColumnText.SHOWN) == Qt.CheckState.Checked)
-                parent = parent.parent()
-
-            for c in range(0, child.columnCount()):
-                if all(_seen):
-                    child.setData(c, Qt.ItemDataRole.ForegroundRole, None)
-                else:
-                    child.setForeground(c, Qt.GlobalColor.gray)
+        # Only this item's ancestors need checking, descendants inherit visibility from their parent
+        parent_visible = True
+        parent = item.parent()
+        while parent and parent_visible:
+            parent_visible = parent.checkState(ElementsColumnText.SHOWN) == Qt.CheckState.Checked
+            parent = parent.parent()
+
+        with s2ui.widgets.batch_changes(self.elements_dock.tree):
+            pending = [(item, parent_visible)]
+            while pending:
+                child, parent_visible = pending.pop()
+                child_visible = parent_visible and child.checkState(ElementsColumnText.SHOWN) == Qt.CheckState.Checked
+
+                for c in range(0, child.columnCount()):
+                    if child_visible:
+                        child.setData(c, Qt.ItemDataRole.ForegroundRole, None)
+                    else:
+                        child.setForeground(c, Qt.GlobalColor.gray)
+
+                for i in range(child.childCount()):
+                    descendant = child.child(i)
+                    if descendant:
+                        pending.append((descendant, child_visible))
 
     def toggle_element_ignored(self):
         """
@@ -1104,4 +1260,4 @@ if __name__ == "__main__":
 
     app = QApplication(sys.argv)
     window = MainInspectorWindow()
-    app.exec()
+    sys.exit(app.exec())
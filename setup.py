@@ -9,20 +9,37 @@ from cx_Freeze import Executable, setup
 build_exe_options = {
     "build_exe": "dist",
     "excludes": [
+        "asyncio",
+        "curses",
+        "distutils",
         "email",
+        "ensurepip",
         "gzip",
+        "lib2to3",
+        "multiprocessing",
+        "pdb",
+        "pydoc",
+        "pydoc_data",
+        "sqlite3",
         "tcl",
+        "test",
         "tk",
         "tkinter",
         "unittest",
         "xml",
-        "zipfile",
+        "xmlrpc",
     ],
     "includes": ["submodules"],
     "include_files": [
         ("data/", "data/"),
     ],
     "optimize": "2",
+    "silent_level": 1,
+
+    # Keep pure Python modules in library.zip (already compiled), rather than thousands of loose files.
+    # PyQt6 stays on disk as Qt locates its plugins and resources relative to the package.
+    "zip_include_packages": ["*"],
+    "zip_exclude_packages": ["PyQt6"],
 }
 
 setup(